@@ -6,6 +6,7 @@ Certificate Verification Blockchain Module
 from .core import Block, Blockchain
 from .smart_contract import CertificateSmartContract
 from .manager import BlockchainManager
+from .merkle import MerkleTree
 
-__all__ = ['Block', 'Blockchain', 'CertificateSmartContract', 'BlockchainManager']
+__all__ = ['Block', 'Blockchain', 'CertificateSmartContract', 'BlockchainManager', 'MerkleTree']
 __version__ = '1.0.0'
\ No newline at end of file
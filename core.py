@@ -5,43 +5,134 @@ Blockchain Core Implementation
 
 import hashlib
 import json
+import logging
 import time
 from datetime import datetime
-from typing import List, Dict, Any
-import pickle
+from typing import List, Dict, Any, Optional, Tuple
 import os
+import pickle
+import struct
+import zlib
+from collections import defaultdict, deque
+from itertools import islice
+from .mining import mine
+from .merkle import MerkleTree
+
+logger = logging.getLogger(__name__)
+
+# Stands in for the nonce when splitting the canonical block encoding
+_NONCE_PLACEHOLDER = "__nonce__"
+_NONCE_PLACEHOLDER_JSON = json.dumps(_NONCE_PLACEHOLDER)
+
+# Encoders built once instead of per json.dumps call. The hashed encodings must stay
+# byte-identical to json.dumps(..., sort_keys=True) or every stored hash breaks
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True, default=str)
+_CERTIFICATE_JSON = json.JSONEncoder(sort_keys=True)
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"), default=str)
+
+# Binary block layout: index, timestamp, nonce, previous_hash, hash, data length
+_BLOCK_HEADER = struct.Struct(">IdQ32s32sI")
+
+# Snapshot layout: magic, then difficulty and block count, then the zlib-compressed blocks
+_SNAPSHOT_MAGIC = b"CVBC\x01"
+_SNAPSHOT_HEADER = struct.Struct(">II")
 
 class Block:
     """Single block in the blockchain"""
-    def __init__(self, index: int, timestamp: float, data: Dict, previous_hash: str):
+    def __init__(self, index: int, timestamp: float, data: Dict, previous_hash: bytes):
         self.index = index
         self.timestamp = timestamp
         self.data = data
         self.previous_hash = previous_hash
         self.nonce = 0
+        # Block contents are fixed after construction, so encode them once
+        self._hash_template_prefix, self._hash_template_suffix = self.hash_template()
         self.hash = self.calculate_hash()
     
-    def calculate_hash(self) -> str:
-        """Calculate SHA-256 hash of the block"""
-        block_string = json.dumps({
+    def __getstate__(self) -> Dict:
+        """Canonical block fields only; the hash template is rebuilt on load"""
+        return {
             "index": self.index,
             "timestamp": self.timestamp,
             "data": self.data,
             "previous_hash": self.previous_hash,
-            "nonce": self.nonce
-        }, sort_keys=True, default=str)
+            "nonce": self.nonce,
+            "hash": self.hash
+        }
+    
+    def __setstate__(self, state: Dict):
+        self.index = state["index"]
+        self.timestamp = state["timestamp"]
+        self.data = state["data"]
+        self.previous_hash = state["previous_hash"]
+        self.nonce = state["nonce"]
+        self.hash = state["hash"]
         
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        # Legacy pickle snapshots, from before hashes were held as raw digests, carry hex strings
+        if isinstance(self.previous_hash, str):
+            self.previous_hash = bytes.fromhex(self.previous_hash)
+        if isinstance(self.hash, str):
+            self.hash = bytes.fromhex(self.hash)
+        
+        self._hash_template_prefix, self._hash_template_suffix = self.hash_template()
+    
+    def calculate_hash(self) -> bytes:
+        """Calculate SHA-256 hash of the block"""
+        return hashlib.sha256(
+            self._hash_template_prefix + str(self.nonce).encode() + self._hash_template_suffix
+        ).digest()
+    
+    def hash_template(self) -> Tuple[bytes, bytes]:
+        """Split the canonical block encoding into the bytes before and after the nonce"""
+        block_string = _CANONICAL_JSON.encode({
+            "index": self.index,
+            "timestamp": self.timestamp,
+            "data": self.data,
+            # Hashes are held as raw digests but encoded as hex, as they always have been
+            "previous_hash": self.previous_hash.hex(),
+            "nonce": _NONCE_PLACEHOLDER
+        })
+        
+        # Only previous_hash and timestamp sort after the nonce, so the last match is ours
+        prefix, _, suffix = block_string.rpartition(_NONCE_PLACEHOLDER_JSON)
+        return prefix.encode(), suffix.encode()
     
     def mine_block(self, difficulty: int):
         """Mine the block with proof-of-work"""
-        target = "0" * difficulty
+        self.nonce, _ = mine(self._hash_template_prefix, self._hash_template_suffix, difficulty, self.nonce)
+        self.hash = self.calculate_hash()
         
-        while self.hash[:difficulty] != target:
-            self.nonce += 1
-            self.hash = self.calculate_hash()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Block %d mined: %.16s...", self.index, self.hash.hex())
+    
+    def to_bytes(self) -> bytes:
+        """Encode block in the compact binary storage format"""
+        data = _COMPACT_JSON.encode(self.data).encode()
+        return _BLOCK_HEADER.pack(
+            self.index, self.timestamp, self.nonce,
+            self.previous_hash, self.hash, len(data)
+        ) + data
+    
+    @classmethod
+    def from_bytes(cls, buffer: bytes, offset: int = 0) -> Tuple["Block", int]:
+        """Decode a block at `offset`, returning it with the offset just past it"""
+        index, timestamp, nonce, previous_hash, block_hash, data_len = _BLOCK_HEADER.unpack_from(buffer, offset)
+        start = offset + _BLOCK_HEADER.size
+        end = start + data_len
+        if end > len(buffer):
+            raise ValueError(f"Truncated data for block {index}")
         
-        print(f"✅ Block {self.index} mined: {self.hash[:16]}...")
+        # Restore the stored hash and nonce as-is rather than re-mining
+        block = cls.__new__(cls)
+        block.__setstate__({
+            "index": index,
+            "timestamp": timestamp,
+            "data": json.loads(buffer[start:end]),
+            "previous_hash": previous_hash,
+            "nonce": nonce,
+            "hash": block_hash
+        })
+        return block, end
     
     def to_dict(self) -> Dict:
         """Convert block to dictionary"""
@@ -50,25 +141,61 @@ class Block:
             "timestamp": self.timestamp,
             "human_time": datetime.fromtimestamp(self.timestamp).isoformat(),
             "data": self.data,
-            "previous_hash": self.previous_hash,
-            "hash": self.hash,
+            "previous_hash": self.previous_hash.hex(),
+            "hash": self.hash.hex(),
             "nonce": self.nonce
         }
     
     def validate(self) -> bool:
         """Validate block integrity"""
-        calculated_hash = self.calculate_hash()
+        # Re-encode from the current fields rather than the cached template,
+        # otherwise tampering with data after construction would go unnoticed
+        prefix, suffix = self.hash_template()
+        calculated_hash = hashlib.sha256(prefix + str(self.nonce).encode() + suffix).digest()
         return calculated_hash == self.hash
 
 class Blockchain:
     """Main blockchain class"""
-    def __init__(self, difficulty: int = 2):  # Lower difficulty for testing
+    SNAPSHOT_FILE = "blockchain_data.bin"
+    SNAPSHOT_INTERVAL = 100  # Blocks appended to the journal between full snapshots
+    RECENT_TRANSACTIONS = 1024  # Registration summaries kept for get_recent_transactions
+    BATCH_SIZE = 64  # Pending certificate transactions that trigger mining a batch block
+    
+    def __init__(self, difficulty: int = 2, filename: str = SNAPSHOT_FILE,
+                 chain: Optional[List[Block]] = None):  # Lower difficulty for testing
         self.chain: List[Block] = []
         self.difficulty = difficulty
         self.pending_transactions = []
         
-        # Create genesis block
-        self.create_genesis_block()
+        # Snapshot on disk plus an append-only journal of blocks added since it was
+        # written; the journal is opened by the first snapshot or by load_from_file
+        self.filename = filename
+        self._journal = None
+        self._journaled_blocks = 0
+        
+        # Lookup indexes over certificate transactions, kept in step with the chain.
+        # A transaction is located by (block index, position within the block)
+        self._hash_index: Dict[str, Tuple[int, int]] = {}
+        self._id_index: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._merkle = MerkleTree()
+        # Location of every certificate transaction, in chain order, so scans over
+        # registrations skip the rest of the chain
+        self._registrations: List[Tuple[int, int]] = []
+        # Ring buffer of the latest registration summaries, see _summarize_registration
+        self._recent: deque = deque(maxlen=self.RECENT_TRANSACTIONS)
+        
+        # Running totals for get_chain_stats and the last block index known to be valid
+        self._total_certificates = 0
+        self._verified_certificates = 0
+        self._validated_upto = 0
+        
+        if chain:
+            # Restore an existing chain, e.g. one decoded from a snapshot
+            self.chain = chain
+            self._rebuild_indexes()
+        else:
+            # Create genesis block
+            self.create_genesis_block()
     
     def create_genesis_block(self):
         """Create the first block in the chain"""
@@ -81,11 +208,12 @@ class Blockchain:
                 "creator": "System",
                 "timestamp": datetime.now().isoformat()
             },
-            previous_hash="0" * 64  # 64 zeros for genesis
+            previous_hash=b"\x00" * 32  # All-zero digest for genesis
         )
         genesis_block.mine_block(self.difficulty)
         self.chain.append(genesis_block)
-        print("✅ Genesis block created")
+        self._index_block(genesis_block)
+        logger.debug("Genesis block created")
     
     def get_latest_block(self) -> Block:
         """Get the latest block in the chain"""
@@ -104,15 +232,166 @@ class Blockchain:
         
         new_block.mine_block(self.difficulty)
         self.chain.append(new_block)
+        self._index_block(new_block)
         
-        # Save to file after adding
-        self.save_to_file()
+        self._persist_block(new_block)
         
         return new_block
     
-    def add_certificate_transaction(self, certificate_data: Dict) -> str:
-        """Add a certificate verification transaction to blockchain"""
-        transaction = {
+    def __getstate__(self) -> Dict:
+        """Canonical chain state only; indexes, caches and the journal are rebuilt on load"""
+        return {
+            "chain": [block.__getstate__() for block in self.chain],
+            "difficulty": self.difficulty,
+            "filename": self.filename,
+            "pending_transactions": self.pending_transactions
+        }
+    
+    def __setstate__(self, state: Dict):
+        # Restoring must never mine a fresh genesis block in place of the pickled chain
+        if not state.get("chain"):
+            raise ValueError("Pickled blockchain has no blocks")
+        
+        chain = []
+        for block_state in state["chain"]:
+            # Legacy pickle snapshots (see _migrate_legacy_snapshot) hold Block instances
+            # instead of their state
+            if isinstance(block_state, Block):
+                chain.append(block_state)
+                continue
+            block = Block.__new__(Block)
+            block.__setstate__(block_state)
+            chain.append(block)
+        
+        # One pass over the chain rebuilds the indexes, Merkle tree and counters
+        self.__init__(difficulty=state["difficulty"],
+                      filename=state.get("filename", self.SNAPSHOT_FILE), chain=chain)
+        self.pending_transactions = state.get("pending_transactions", [])
+    
+    @staticmethod
+    def _journal_path(filename: str) -> str:
+        return os.path.splitext(filename)[0] + ".log"
+    
+    def _open_journal(self, size: int = 0):
+        """Open the journal for appending, dropping anything past `size` bytes"""
+        if self._journal is not None:
+            self._journal.close()
+        self._journal = open(self._journal_path(self.filename), 'ab')
+        self._journal.truncate(size)
+    
+    def _persist_block(self, block: Block):
+        """Append a block to the journal, or fold everything into a new snapshot"""
+        if self._journal is None or self._journaled_blocks >= self.SNAPSHOT_INTERVAL:
+            self.save_to_file()
+            return
+        
+        try:
+            record = block.to_bytes()
+            self._journal.write(len(record).to_bytes(4, 'big') + record)
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._journaled_blocks += 1
+        except Exception as e:
+            logger.error("Error journaling block %d: %s", block.index, e)
+    
+    def _replay_journal(self) -> int:
+        """Append journaled blocks newer than the snapshot and return the end of the last good record"""
+        self._journaled_blocks = 0
+        path = self._journal_path(self.filename)
+        if not os.path.exists(path):
+            return 0
+        
+        with open(path, 'rb') as f:
+            journal = f.read()
+        
+        offset = 0
+        while offset + 4 <= len(journal):
+            end = offset + 4 + int.from_bytes(journal[offset:offset + 4], 'big')
+            if end > len(journal):
+                break  # Torn write from an interrupted append
+            
+            try:
+                block, _ = Block.from_bytes(journal[offset + 4:end])
+            except Exception:
+                break
+            
+            # Records already folded into the snapshot are skipped, anything that
+            # does not extend the chain ends the replay
+            if block.index >= len(self.chain):
+                if block.index != len(self.chain) or block.previous_hash != self.chain[-1].hash:
+                    break
+                self.chain.append(block)
+                self._index_block(block)
+            
+            self._journaled_blocks += 1
+            offset = end
+        
+        return offset
+    
+    def close(self):
+        """Mine any pending transactions, write a final snapshot and release the journal"""
+        self.flush_pending_transactions()
+        if self._journal is not None:
+            self.save_to_file()
+            self._journal.close()
+            self._journal = None
+    
+    @staticmethod
+    def _certificate_transactions(block: Block) -> List[Dict]:
+        """Certificate transactions recorded in a single or batch registration block"""
+        transaction_type = block.data.get("transaction_type")
+        if transaction_type == "certificate_registration":
+            return [block.data.get("transaction", {})]
+        if transaction_type == "certificate_batch":
+            return block.data.get("transactions", [])
+        return []
+    
+    def _index_block(self, block: Block, summarize: bool = True):
+        """Record a block in the Merkle tree and its certificate transactions in the lookup indexes"""
+        self._merkle.append(block.hash)
+        
+        for position, transaction in enumerate(self._certificate_transactions(block)):
+            location = (block.index, position)
+            self._registrations.append(location)
+            if summarize:
+                self._recent.append(self._summarize_registration(block, transaction))
+            self._total_certificates += 1
+            if not transaction:
+                continue  # Registration block without a transaction payload
+            
+            # The first registration of a hash wins, matching a front-to-back scan
+            self._hash_index.setdefault(transaction.get("hash"), location)
+            self._id_index[transaction.get("certificate_id")].append(location)
+            
+            if transaction.get("verification_status") == "verified":
+                self._verified_certificates += 1
+    
+    def _rebuild_indexes(self):
+        """Rebuild the lookup indexes and counters with a single pass over the chain"""
+        self._hash_index = {}
+        self._id_index = defaultdict(list)
+        self._merkle = MerkleTree()
+        self._registrations = []
+        self._total_certificates = 0
+        self._verified_certificates = 0
+        self._validated_upto = 0
+        for block in self.chain:
+            self._index_block(block, summarize=False)
+        
+        # Summarize only the registrations the ring buffer keeps, not the whole chain
+        self._recent = deque(
+            (self._summarize_registration(self.chain[block_index],
+                                          self._certificate_transactions(self.chain[block_index])[position])
+             for block_index, position in self._registrations[-self.RECENT_TRANSACTIONS:]),
+            maxlen=self.RECENT_TRANSACTIONS
+        )
+    
+    def create_certificate_transaction(self, certificate_data: Dict) -> Dict:
+        """Build the certificate verification transaction recorded on chain"""
+        # One timestamp for the whole registration, so the stored hash can be reproduced
+        verified_at = datetime.now().isoformat()
+        
+        return {
             "type": "certificate_verification",
             "certificate_id": certificate_data.get("certificate_id"),
             "certificate_number": certificate_data.get("certificate_number"),
@@ -121,132 +400,278 @@ class Blockchain:
             "owner_name": certificate_data.get("owner_name", "Unknown"),
             "verification_status": certificate_data.get("verification_status", "pending"),
             "verified_by": certificate_data.get("verified_by"),
-            "verified_at": datetime.now().isoformat(),
-            "hash": self.calculate_certificate_hash(certificate_data),
+            "verified_at": verified_at,
+            "hash": self.calculate_certificate_hash(certificate_data, verified_at),
             "metadata": {
                 "confidence_score": certificate_data.get("confidence_score", 0),
                 "file_hash": certificate_data.get("file_hash", ""),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": verified_at
             }
         }
-        
-        block = self.add_block({
+    
+    def add_certificate_block(self, certificate_data: Dict) -> Block:
+        """Mine a certificate verification transaction into its own block and return the block"""
+        return self.add_block({
             "transaction_type": "certificate_registration",
-            "transaction": transaction
+            "transaction": self.create_certificate_transaction(certificate_data)
         })
+    
+    def add_certificate_transaction(self, certificate_data: Dict) -> str:
+        """Add a certificate verification transaction to blockchain"""
+        return self.add_certificate_block(certificate_data).hash.hex()
+    
+    def queue_certificate_transaction(self, certificate_data: Dict) -> str:
+        """Queue a certificate transaction for the next batch block and return its certificate hash"""
+        transaction = self.create_certificate_transaction(certificate_data)
+        self.pending_transactions.append(transaction)
+        
+        if len(self.pending_transactions) >= self.BATCH_SIZE:
+            self.flush_pending_transactions()
         
-        return block.hash
+        return transaction["hash"]
     
-    def calculate_certificate_hash(self, certificate_data: Dict) -> str:
-        """Calculate unique hash for a certificate"""
-        cert_string = json.dumps({
+    def flush_pending_transactions(self) -> Optional[Block]:
+        """Mine all pending certificate transactions into one batch block"""
+        if not self.pending_transactions:
+            return None
+        
+        # One proof-of-work covers the whole batch
+        transactions, self.pending_transactions = self.pending_transactions, []
+        try:
+            return self.add_block({
+                "transaction_type": "certificate_batch",
+                "transactions": transactions
+            })
+        except Exception:
+            # Keep the batch pending rather than losing it with the failed block
+            self.pending_transactions = transactions + self.pending_transactions
+            raise
+    
+    def calculate_certificate_hash(self, certificate_data: Dict, timestamp: Optional[str] = None) -> str:
+        """Calculate unique hash for a certificate registered at `timestamp` (defaults to now)"""
+        cert_string = _CERTIFICATE_JSON.encode({
             "certificate_number": certificate_data.get("certificate_number"),
             "owner_id": certificate_data.get("owner_id"),
             "file_hash": certificate_data.get("file_hash", ""),
-            "timestamp": datetime.now().isoformat()
-        }, sort_keys=True)
+            "timestamp": timestamp or datetime.now().isoformat()
+        })
         
         return hashlib.sha256(cert_string.encode()).hexdigest()
     
     def verify_certificate(self, certificate_hash: str) -> Dict:
         """Verify if a certificate exists in blockchain"""
-        for block in self.chain:
-            if (block.data.get("transaction_type") == "certificate_registration" and 
-                "transaction" in block.data):
-                transaction = block.data.get("transaction", {})
-                if transaction.get("hash") == certificate_hash:
-                    return {
-                        "exists": True,
-                        "verified": True,
-                        "block_index": block.index,
-                        "block_hash": block.hash,
-                        "timestamp": block.timestamp,
-                        "human_time": datetime.fromtimestamp(block.timestamp).isoformat(),
-                        "transaction": transaction,
-                        "verification_status": "VALID"
-                    }
-        
-        return {"exists": False, "verified": False, "verification_status": "NOT_FOUND"}
+        location = self._hash_index.get(certificate_hash)
+        if location is None:
+            return {"exists": False, "verified": False, "verification_status": "NOT_FOUND"}
+        
+        block_index, position = location
+        block = self.chain[block_index]
+        return {
+            "exists": True,
+            "verified": True,
+            "block_index": block.index,
+            "block_hash": block.hash.hex(),
+            "timestamp": block.timestamp,
+            "human_time": datetime.fromtimestamp(block.timestamp).isoformat(),
+            "transaction": self._certificate_transactions(block)[position],
+            "verification_status": "VALID"
+        }
     
     def get_certificate_history(self, certificate_id: str) -> List[Dict]:
         """Get complete history of a certificate from blockchain"""
         history = []
         
-        for block in self.chain:
-            if (block.data.get("transaction_type") == "certificate_registration" and 
-                "transaction" in block.data):
-                transaction = block.data.get("transaction", {})
-                if transaction.get("certificate_id") == certificate_id:
-                    history.append({
-                        "block_index": block.index,
-                        "timestamp": datetime.fromtimestamp(block.timestamp).isoformat(),
-                        "transaction": transaction,
-                        "block_hash": block.hash
-                    })
+        for block_index, position in self._id_index.get(certificate_id, ()):
+            block = self.chain[block_index]
+            history.append({
+                "block_index": block.index,
+                "timestamp": datetime.fromtimestamp(block.timestamp).isoformat(),
+                "transaction": self._certificate_transactions(block)[position],
+                "block_hash": block.hash.hex()
+            })
         
         return history
     
+    @staticmethod
+    def _summarize_registration(block: Block, transaction: Dict) -> Tuple:
+        """Flatten a registration to (block_index, timestamp, certificate_number, type, status, hash prefix)"""
+        return (
+            block.index,
+            datetime.fromtimestamp(block.timestamp).isoformat(),
+            transaction.get("certificate_number", "Unknown"),
+            transaction.get("certificate_type", "Unknown"),
+            transaction.get("verification_status", "pending"),
+            block.hash.hex()[:16] + "..."
+        )
+    
+    def get_recent_transactions(self, limit: int = 10) -> List[Tuple]:
+        """Get summaries of the most recent certificate registrations, newest first"""
+        if limit <= 0:
+            return []
+        if limit <= len(self._recent) or len(self._recent) == len(self._registrations):
+            return list(islice(reversed(self._recent), limit))
+        
+        # Asked for more than the ring buffer holds
+        recent = []
+        for block_index, position in self._registrations[:-limit - 1:-1]:
+            block = self.chain[block_index]
+            recent.append(self._summarize_registration(block, self._certificate_transactions(block)[position]))
+        return recent
+    
     def is_chain_valid(self) -> bool:
-        """Validate the entire blockchain"""
-        for i in range(1, len(self.chain)):
+        """Validate blocks appended since the last successful check"""
+        for i in range(max(1, self._validated_upto + 1), len(self.chain)):
             current_block = self.chain[i]
             previous_block = self.chain[i-1]
             
             # Check if current block hash is valid
             if not current_block.validate():
-                print(f"❌ Invalid hash at block {i}")
+                logger.warning("Invalid hash at block %d", i)
                 return False
             
             # Check if previous hash matches
             if current_block.previous_hash != previous_block.hash:
-                print(f"❌ Invalid previous hash at block {i}")
+                logger.warning("Invalid previous hash at block %d", i)
                 return False
         
+        self._validated_upto = len(self.chain) - 1
         return True
     
-    def get_chain_stats(self) -> Dict:
-        """Get blockchain statistics"""
-        total_certificates = 0
-        verified_certificates = 0
+    def full_validate(self) -> bool:
+        """Validate the entire blockchain from the genesis block"""
+        self._validated_upto = 0
+        if not self.is_chain_valid():
+            return False
         
-        for block in self.chain:
-            if block.data.get("transaction_type") == "certificate_registration":
-                total_certificates += 1
-                transaction = block.data.get("transaction", {})
-                if transaction.get("verification_status") == "verified":
-                    verified_certificates += 1
+        # A consistently re-mined history passes the link checks but not the
+        # Merkle root recorded as the blocks were appended
+        if MerkleTree(block.hash for block in self.chain).root != self._merkle.root:
+            logger.warning("Merkle root mismatch")
+            self._validated_upto = 0
+            return False
         
+        return True
+    
+    def get_merkle_root(self) -> Optional[str]:
+        """Get the Merkle root over all block hashes"""
+        root = self._merkle.root
+        return root.hex() if root else None
+    
+    def get_merkle_proof(self, block_index: int) -> Dict:
+        """Get the O(log n) Merkle authentication path for a block"""
+        block = self.chain[block_index]
+        return {
+            "block_index": block.index,
+            "block_hash": block.hash.hex(),
+            "merkle_root": self.get_merkle_root(),
+            "proof": [
+                {"hash": sibling.hex(), "position": side}
+                for sibling, side in self._merkle.get_proof(block_index)
+            ]
+        }
+    
+    def get_chain_stats(self) -> Dict:
+        """Get blockchain statistics"""
         return {
             "total_blocks": len(self.chain),
-            "total_certificates": total_certificates,
-            "verified_certificates": verified_certificates,
+            "total_certificates": self._total_certificates,
+            "verified_certificates": self._verified_certificates,
             "chain_valid": self.is_chain_valid(),
+            "merkle_root": self.get_merkle_root(),
             "difficulty": self.difficulty,
-            "latest_block_hash": self.get_latest_block().hash if self.chain else None,
+            "latest_block_hash": self.get_latest_block().hash.hex() if self.chain else None,
             "latest_block_index": len(self.chain) - 1
         }
     
-    def save_to_file(self, filename: str = "blockchain_data.pkl"):
-        """Save blockchain to file"""
+    def save_to_file(self, filename: Optional[str] = None):
+        """Save a full snapshot of the blockchain to file"""
+        filename = filename or self.filename
         try:
-            with open(filename, 'wb') as f:
-                pickle.dump(self, f)
-            print(f"✅ Blockchain saved to {filename}")
+            # Write beside the target and swap it in so a crash never leaves a partial snapshot
+            temp_filename = filename + ".tmp"
+            with open(temp_filename, 'wb') as f:
+                f.write(self.to_bytes())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_filename, filename)
+            
+            # The snapshot now covers every journaled block
+            if filename == self.filename:
+                self._open_journal()
+                self._journaled_blocks = 0
+            logger.debug("Blockchain saved to %s", filename)
         except Exception as e:
-            print(f"❌ Error saving blockchain: {e}")
+            logger.error("Error saving blockchain: %s", e)
     
     @staticmethod
-    def load_from_file(filename: str = "blockchain_data.pkl"):
-        """Load blockchain from file"""
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'rb') as f:
-                    blockchain = pickle.load(f)
-                print(f"✅ Blockchain loaded from {filename}")
-                return blockchain
-            except Exception as e:
-                print(f"❌ Error loading blockchain: {e}")
-        return None
+    def load_from_file(filename: str = SNAPSHOT_FILE):
+        """Load blockchain snapshot from file and replay its journal"""
+        legacy_filename = os.path.splitext(filename)[0] + ".pkl"
+        if not os.path.exists(filename) and os.path.exists(legacy_filename):
+            return Blockchain._migrate_legacy_snapshot(legacy_filename, filename)
+        
+        if not os.path.exists(filename):
+            return None
+        
+        # An unreadable snapshot must not fall through to a fresh chain either: its
+        # first block would overwrite the snapshot and truncate the journal
+        try:
+            with open(filename, 'rb') as f:
+                blockchain = Blockchain.from_bytes(f.read(), filename)
+            journal_size = blockchain._replay_journal()
+            blockchain._open_journal(journal_size)
+        except Exception as e:
+            raise RuntimeError(f"Cannot load blockchain {filename}: {e}") from e
+        
+        logger.info("Blockchain loaded from %s", filename)
+        return blockchain
+    
+    @staticmethod
+    def _migrate_legacy_snapshot(legacy_filename: str, filename: str) -> "Blockchain":
+        """Convert a pickle snapshot from before the binary format, once"""
+        logger.info("Migrating legacy blockchain snapshot %s to %s", legacy_filename, filename)
+        # A failed migration must not fall through to a fresh chain, which would
+        # orphan every certificate already registered
+        try:
+            with open(legacy_filename, 'rb') as f:
+                blockchain = _LegacySnapshotUnpickler(f).load()
+        except Exception as e:
+            raise RuntimeError(f"Cannot migrate legacy blockchain {legacy_filename}: {e}") from e
+        
+        if not blockchain.full_validate():
+            raise RuntimeError(f"Legacy blockchain {legacy_filename} failed validation")
+        
+        blockchain.filename = filename
+        blockchain.save_to_file()
+        if not os.path.exists(filename):
+            raise RuntimeError(f"Could not write migrated blockchain to {filename}")
+        
+        # The legacy file is kept as a backup but never read again once the snapshot exists
+        logger.info("Migrated %d blocks from %s", len(blockchain.chain), legacy_filename)
+        return blockchain
+    
+    def to_bytes(self) -> bytes:
+        """Encode the chain as a compressed binary snapshot"""
+        blocks = b"".join(block.to_bytes() for block in self.chain)
+        return (_SNAPSHOT_MAGIC + _SNAPSHOT_HEADER.pack(self.difficulty, len(self.chain)) +
+                zlib.compress(blocks, 6))
+    
+    @staticmethod
+    def from_bytes(snapshot: bytes, filename: str = SNAPSHOT_FILE) -> "Blockchain":
+        """Decode a binary snapshot produced by to_bytes"""
+        if not snapshot.startswith(_SNAPSHOT_MAGIC):
+            raise ValueError("Not a blockchain snapshot")
+        
+        difficulty, count = _SNAPSHOT_HEADER.unpack_from(snapshot, len(_SNAPSHOT_MAGIC))
+        blocks = zlib.decompress(snapshot[len(_SNAPSHOT_MAGIC) + _SNAPSHOT_HEADER.size:])
+        
+        chain = []
+        offset = 0
+        for _ in range(count):
+            block, offset = Block.from_bytes(blocks, offset)
+            chain.append(block)
+        
+        return Blockchain(difficulty=difficulty, filename=filename, chain=chain)
     
     def to_dict(self) -> Dict:
         """Convert entire blockchain to dictionary"""
@@ -255,4 +680,12 @@ class Blockchain:
             "difficulty": self.difficulty,
             "length": len(self.chain),
             "is_valid": self.is_chain_valid()
-        }
\ No newline at end of file
+        }
+
+class _LegacySnapshotUnpickler(pickle.Unpickler):
+    """Unpickler for legacy snapshots that resolves only the blockchain classes"""
+    def find_class(self, module: str, name: str):
+        # Match on the module's last component so snapshots survive a package rename
+        if module.rsplit(".", 1)[-1] == "core" and name in ("Block", "Blockchain"):
+            return Block if name == "Block" else Blockchain
+        raise pickle.UnpicklingError(f"Unexpected class {module}.{name} in legacy snapshot")
\ No newline at end of file
@@ -3,43 +3,52 @@
 Blockchain Manager - Singleton for blockchain operations
 """
 
+import atexit
+import logging
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List
 from .core import Blockchain
 from .smart_contract import CertificateSmartContract
 
+logger = logging.getLogger(__name__)
+
 class BlockchainManager:
     """Singleton manager for blockchain operations"""
     _instance = None
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(BlockchainManager, cls).__new__(cls)
-            cls._instance.init_blockchain()
+            # Cache the instance only once it has a chain, so a failed load is retried
+            instance = super(BlockchainManager, cls).__new__(cls)
+            instance.init_blockchain()
+            cls._instance = instance
         return cls._instance
     
     def init_blockchain(self):
         """Initialize or load blockchain"""
-        print("🔄 Initializing blockchain...")
+        logger.info("Initializing blockchain...")
         self.blockchain = Blockchain.load_from_file()
         if not self.blockchain:
             self.blockchain = Blockchain(difficulty=2)  # Lower difficulty for testing
-            print("✅ New blockchain created")
+            logger.info("New blockchain created")
         else:
-            print(f"✅ Blockchain loaded with {len(self.blockchain.chain)} blocks")
+            logger.info("Blockchain loaded with %d blocks", len(self.blockchain.chain))
+        
+        # Fold the journal into a final snapshot on interpreter shutdown
+        atexit.register(self.blockchain.close)
         
         self.smart_contract = CertificateSmartContract()
-        print(f"✅ Smart contract initialized")
+        logger.info("Smart contract initialized")
     
     def register_certificate(self, certificate_data: Dict) -> Dict:
         """Register a certificate on blockchain"""
-        print(f"🔄 Registering certificate {certificate_data.get('certificate_number')}...")
+        logger.debug("Registering certificate %s...", certificate_data.get("certificate_number"))
         
         # Validate with smart contract first
         validation_result = self.smart_contract.validate_certificate(certificate_data)
         
         if not validation_result["valid"]:
-            print(f"❌ Certificate failed smart contract validation")
+            logger.info("Certificate %s failed smart contract validation", certificate_data.get("certificate_number"))
             return {
                 "success": False,
                 "error": "Certificate failed smart contract validation",
@@ -48,31 +57,116 @@ class BlockchainManager:
         
         # Add to blockchain
         try:
-            block_hash = self.blockchain.add_certificate_transaction(certificate_data)
-            cert_hash = self.blockchain.calculate_certificate_hash(certificate_data)
+            # Read everything from the block this call mined, not whichever block is newest
+            block = self.blockchain.add_certificate_block(certificate_data)
+            block_hash = block.hash.hex()
+            cert_hash = block.data["transaction"]["hash"]
             
-            print(f"✅ Certificate registered on blockchain")
-            print(f"   Block Hash: {block_hash[:16]}...")
-            print(f"   Cert Hash: {cert_hash[:16]}...")
+            logger.debug("Certificate registered on blockchain (block %.16s..., cert %.16s...)",
+                         block_hash, cert_hash)
             
             return {
                 "success": True,
                 "block_hash": block_hash,
-                "block_index": len(self.blockchain.chain) - 1,
+                "block_index": block.index,
                 "certificate_hash": cert_hash,
                 "validation_result": validation_result,
                 "timestamp": datetime.now().isoformat()
             }
         except Exception as e:
-            print(f"❌ Error registering certificate: {e}")
+            logger.exception("Error registering certificate: %s", e)
             return {
                 "success": False,
                 "error": str(e)
             }
     
+    def register_certificates(self, certificates: List[Dict]) -> Dict:
+        """Register several certificates, mining them into shared batch blocks"""
+        logger.debug("Registering batch of %d certificates...", len(certificates))
+        
+        # Validate the whole batch before queuing anything, so a bad entry cannot
+        # leave earlier certificates pending or mined without a receipt
+        try:
+            validation_results = [
+                self.smart_contract.validate_certificate(certificate_data)
+                for certificate_data in certificates
+            ]
+        except Exception as e:
+            logger.exception("Error validating certificate batch: %s", e)
+            return {
+                "success": False,
+                "error": str(e),
+                "registered": 0,
+                "receipts": []
+            }
+        
+        receipts = []
+        queued = set()
+        error = None
+        try:
+            for certificate_data, validation_result in zip(certificates, validation_results):
+                if not validation_result["valid"]:
+                    receipts.append({
+                        "success": False,
+                        "certificate_number": certificate_data.get("certificate_number"),
+                        "error": "Certificate failed smart contract validation",
+                        "validation_result": validation_result
+                    })
+                    continue
+                
+                cert_hash = self.blockchain.queue_certificate_transaction(certificate_data)
+                queued.add(cert_hash)
+                receipts.append({
+                    "success": True,
+                    "certificate_number": certificate_data.get("certificate_number"),
+                    "certificate_hash": cert_hash,
+                    "validation_result": validation_result
+                })
+            
+            # Mine whatever did not fill a whole batch so every receipt is final
+            self.blockchain.flush_pending_transactions()
+        except Exception as e:
+            logger.exception("Error registering certificate batch: %s", e)
+            error = str(e)
+            # Withdraw this call's unmined transactions; blocks already mined stay
+            # on chain and are reported below, so a retry need not resend them
+            self.blockchain.pending_transactions = [
+                transaction for transaction in self.blockchain.pending_transactions
+                if transaction["hash"] not in queued
+            ]
+        
+        for receipt in receipts:
+            if not receipt["success"]:
+                continue
+            verification = self.blockchain.verify_certificate(receipt["certificate_hash"])
+            if verification["exists"]:
+                receipt["block_hash"] = verification["block_hash"]
+                receipt["block_index"] = verification["block_index"]
+            else:
+                receipt["success"] = False
+                receipt["error"] = f"Certificate was not mined: {error}"
+        
+        registered = sum(1 for receipt in receipts if receipt["success"])
+        logger.debug("%d/%d certificates registered on blockchain", registered, len(certificates))
+        
+        # Every failed result carries an error, as register_certificate's do
+        if error is None and registered == 0:
+            error = ("No certificates passed smart contract validation" if certificates
+                     else "No certificates provided")
+        
+        result = {
+            "success": error is None and registered > 0,
+            "registered": registered,
+            "receipts": receipts,
+            "timestamp": datetime.now().isoformat()
+        }
+        if error is not None:
+            result["error"] = error
+        return result
+    
     def verify_certificate(self, certificate_hash: str) -> Dict:
         """Verify certificate on blockchain"""
-        print(f"🔄 Verifying certificate hash: {certificate_hash[:16]}...")
+        logger.debug("Verifying certificate hash: %.16s...", certificate_hash)
         return self.blockchain.verify_certificate(certificate_hash)
     
     def get_certificate_history(self, certificate_id: str) -> Dict:
@@ -96,6 +190,7 @@ class BlockchainManager:
                 "total_certificates": stats["total_certificates"],
                 "verified_certificates": stats["verified_certificates"],
                 "chain_valid": stats["chain_valid"],
+                "merkle_root": stats["merkle_root"],
                 "difficulty": stats["difficulty"],
                 "latest_block_hash": stats["latest_block_hash"],
                 "latest_block_index": stats["latest_block_index"]
@@ -106,7 +201,7 @@ class BlockchainManager:
     
     def validate_chain(self) -> Dict:
         """Validate entire blockchain"""
-        is_valid = self.blockchain.is_chain_valid()
+        is_valid = self.blockchain.full_validate()
         
         return {
             "chain_valid": is_valid,
@@ -114,23 +209,26 @@ class BlockchainManager:
             "validation_timestamp": datetime.now().isoformat()
         }
     
+    def get_merkle_proof(self, block_index: int) -> Dict:
+        """Get Merkle inclusion proof for a block"""
+        if not 0 <= block_index < len(self.blockchain.chain):
+            return {"exists": False, "block_index": block_index}
+        
+        proof = self.blockchain.get_merkle_proof(block_index)
+        proof["exists"] = True
+        return proof
+    
     def get_recent_transactions(self, limit: int = 10) -> list:
         """Get recent certificate transactions"""
-        recent = []
-        count = 0
-        
-        for block in reversed(self.blockchain.chain):
-            if block.data.get("transaction_type") == "certificate_registration":
-                recent.append({
-                    "block_index": block.index,
-                    "timestamp": datetime.fromtimestamp(block.timestamp).isoformat(),
-                    "certificate_number": block.data.get("transaction", {}).get("certificate_number", "Unknown"),
-                    "type": block.data.get("transaction", {}).get("certificate_type", "Unknown"),
-                    "status": block.data.get("transaction", {}).get("verification_status", "pending"),
-                    "block_hash": block.hash[:16] + "..."
-                })
-                count += 1
-                if count >= limit:
-                    break
-        
-        return recent
\ No newline at end of file
+        return [
+            {
+                "block_index": block_index,
+                "timestamp": timestamp,
+                "certificate_number": certificate_number,
+                "type": certificate_type,
+                "status": status,
+                "block_hash": block_hash
+            }
+            for block_index, timestamp, certificate_number, certificate_type, status, block_hash
+            in self.blockchain.get_recent_transactions(limit)
+        ]
\ No newline at end of file
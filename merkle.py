@@ -0,0 +1,73 @@
+# backend/app/blockchain/merkle.py
+"""
+Append-only Merkle Tree over Block Hashes
+"""
+
+import hashlib
+from typing import Iterable, List, Optional, Tuple
+
+def _hash_pair(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(left + right).digest()
+
+class MerkleTree:
+    """Merkle tree whose leaves are appended one block hash at a time"""
+    def __init__(self, leaves: Iterable[bytes] = ()):
+        # levels[0] holds the leaves, levels[-1] the root once there is one
+        self.levels: List[List[bytes]] = [[]]
+        for leaf in leaves:
+            self.append(leaf)
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    @property
+    def root(self) -> Optional[bytes]:
+        """Root hash, or None for an empty tree"""
+        top = self.levels[-1]
+        return top[0] if top else None
+
+    def append(self, leaf: bytes):
+        """Add a leaf and refresh only the nodes on its path to the root"""
+        self.levels[0].append(leaf)
+        index = len(self.levels[0]) - 1
+        level = 0
+
+        while len(self.levels[level]) > 1:
+            nodes = self.levels[level]
+            left = nodes[index & ~1]
+            # An unpaired last node is hashed with itself
+            right = nodes[index | 1] if index | 1 < len(nodes) else left
+
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            parents = self.levels[level + 1]
+            index >>= 1
+            if index < len(parents):
+                parents[index] = _hash_pair(left, right)
+            else:
+                parents.append(_hash_pair(left, right))
+            level += 1
+
+    def get_proof(self, index: int) -> List[Tuple[bytes, str]]:
+        """Authentication path for a leaf as (sibling hash, sibling side) pairs"""
+        if not 0 <= index < len(self):
+            raise IndexError(f"No leaf at index {index}")
+
+        proof = []
+        for nodes in self.levels[:-1]:
+            sibling = index ^ 1
+            if index & 1:
+                proof.append((nodes[sibling], "left"))
+            else:
+                proof.append((nodes[sibling] if sibling < len(nodes) else nodes[index], "right"))
+            index >>= 1
+
+        return proof
+
+    @staticmethod
+    def verify_proof(leaf: bytes, proof: List[Tuple[bytes, str]], root: bytes) -> bool:
+        """Check that a leaf and its authentication path hash up to root"""
+        node = leaf
+        for sibling, side in proof:
+            node = _hash_pair(sibling, node) if side == "left" else _hash_pair(node, sibling)
+        return node == root
\ No newline at end of file
@@ -0,0 +1,107 @@
+# backend/app/blockchain/mining.py
+"""
+Proof-of-Work Nonce Search
+"""
+
+import hashlib
+import multiprocessing
+import os
+import queue
+from typing import Optional, Tuple
+
+# Nonces tried per call into mine_batch
+MINE_BATCH_SIZE = 4096
+
+# Below this difficulty one process finds a nonce before worker processes have started
+PARALLEL_MIN_DIFFICULTY = 5
+
+def _available_cpus() -> int:
+    """CPUs this process may run on, honouring affinity masks where the platform has them"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def mine_batch(midstate, suffix: bytes, start_nonce: int, count: int,
+               difficulty: int) -> Optional[Tuple[int, bytes]]:
+    """Try `count` nonces from `start_nonce` and return the first (nonce, hash) meeting the target"""
+    # `difficulty` leading zero hex digits are `full` zero bytes plus, for an odd
+    # difficulty, a byte whose high nibble is zero
+    full, odd = divmod(difficulty, 2)
+    zero_prefix = bytes(full)
+    copy = midstate.copy
+
+    for nonce in range(start_nonce, start_nonce + count):
+        sha = copy()
+        sha.update(b"%d%s" % (nonce, suffix))
+        digest = sha.digest()
+        if digest[:full] == zero_prefix and (not odd or digest[full] < 0x10):
+            return nonce, digest
+
+    return None
+
+def _mine_stripe(prefix: bytes, suffix: bytes, difficulty: int, start_nonce: int, stride: int,
+                 found, results):
+    """Worker loop: scan one batch every `stride` nonces until some worker finds a hit"""
+    # Hash objects do not pickle, so each worker derives its own midstate
+    midstate = hashlib.sha256(prefix)
+    nonce = start_nonce
+
+    while not found.is_set():
+        hit = mine_batch(midstate, suffix, nonce, MINE_BATCH_SIZE, difficulty)
+        if hit is not None:
+            found.set()
+            results.put(hit)
+            return
+        nonce += stride
+
+def mine_parallel(prefix: bytes, suffix: bytes, difficulty: int, start_nonce: int = 0,
+                  workers: Optional[int] = None) -> Tuple[int, bytes]:
+    """Search disjoint nonce stripes in worker processes and return the first hit reported"""
+    workers = workers or _available_cpus()
+    found = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    stride = workers * MINE_BATCH_SIZE
+
+    processes = [
+        multiprocessing.Process(
+            target=_mine_stripe,
+            args=(prefix, suffix, difficulty, start_nonce + worker * MINE_BATCH_SIZE, stride,
+                  found, results),
+            daemon=True
+        )
+        for worker in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        while True:
+            try:
+                return results.get(timeout=1)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    raise RuntimeError("All mining workers exited without a result")
+    finally:
+        # Stop the remaining workers once one nonce is in hand
+        found.set()
+        for process in processes:
+            process.join()
+
+def mine(prefix: bytes, suffix: bytes, difficulty: int, start_nonce: int = 0,
+         workers: Optional[int] = None) -> Tuple[int, bytes]:
+    """Find a nonce from `start_nonce` whose hash meets the difficulty target"""
+    workers = workers or _available_cpus()
+    # Daemonic processes may not start children, so they always mine serially
+    if (difficulty >= PARALLEL_MIN_DIFFICULTY and workers > 1 and
+            not multiprocessing.current_process().daemon):
+        return mine_parallel(prefix, suffix, difficulty, start_nonce, workers)
+
+    # Hash the constant prefix once and resume from its midstate per nonce
+    midstate = hashlib.sha256(prefix)
+    nonce = start_nonce
+
+    while True:
+        found = mine_batch(midstate, suffix, nonce, MINE_BATCH_SIZE, difficulty)
+        if found is not None:
+            return found
+        nonce += MINE_BATCH_SIZE
\ No newline at end of file